@@ -5,23 +5,55 @@
 NewsAPI client wrapper for cybersecurity news in DACH region.
 """
 
+import hashlib
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import diskcache
+import requests
 from newsapi import NewsApiClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.logger import get_logger
+from src.utils.rate_limiter import TokenBucket
+
+logger = get_logger(__name__)
+
+# NewsAPI developer plan quota; paid plans allow considerably more.
+DEFAULT_REQUESTS_PER_DAY = 100
+DEFAULT_BURST_SIZE = 10
+
+CACHE_DIR = os.path.expanduser('~/.cache/newsapi')
+# Responses whose date window reaches today may still change, so they expire.
+CACHE_EXPIRE_SECONDS = 86400
 
 
 class NewsAPIWrapper:
     """Wrapper for NewsAPI client with cybersecurity specific functionality."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, requests_per_day: int = DEFAULT_REQUESTS_PER_DAY,
+                 burst_size: int = DEFAULT_BURST_SIZE):
         """Initialize the NewsAPI client.
         
         Args:
             api_key: NewsAPI key.
+            requests_per_day: Request quota of the NewsAPI plan, used to pace calls.
+            burst_size: Number of calls that may be made back-to-back before pacing kicks in.
         """
-        self.api = NewsApiClient(api_key=api_key)
+        # Share one keep-alive session across calls so the TLS connection to
+        # newsapi.org is reused. Rate limiting (429) is left to the token
+        # bucket below; transient server errors are retried by urllib3.
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=['GET'], raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        self.api = NewsApiClient(api_key=api_key, session=self.session)
+        self.bucket = TokenBucket(capacity=burst_size, refill_rate=requests_per_day / 86400)
+        self.cache = diskcache.Cache(CACHE_DIR)
         self.dach_countries = ['de', 'at', 'ch']  # Germany, Austria, Switzerland
         self.cybersecurity_keywords = [
             'cybersecurity', 'cyber security', 'cyber-security',
@@ -30,6 +62,52 @@ class NewsAPIWrapper:
             'datenschutz', 'datenleck', 'cyberkriminalität', 'it-sicherheit',
             'datensicherheit', 'hackerangriff'
         ]
+        self._query_string = ' OR '.join(f'"{kw}"' for kw in self.cybersecurity_keywords)
+        
+    def _call(self, fn: Callable[..., Dict[str, Any]], **kwargs: Any) -> Dict[str, Any]:
+        """Call a NewsAPI client method, pacing it through the token bucket.
+        
+        Args:
+            fn: Bound NewsApiClient method to call.
+            **kwargs: Parameters passed to the method.
+            
+        Returns:
+            Raw NewsAPI response.
+            
+        Raises:
+            NewsAPIException: If the request fails. A 'rateLimited' error means
+                the daily quota is used up, so it is not retried.
+        """
+        self.bucket.acquire(1)
+        return fn(**kwargs)
+        
+    def _cached_call(self, endpoint_name: str, **params: Any) -> Dict[str, Any]:
+        """Call a NewsAPI endpoint, serving repeated queries from the on-disk cache.
+        
+        Args:
+            endpoint_name: Name of the NewsApiClient method, e.g. 'get_everything'.
+            **params: Parameters passed to the endpoint.
+            
+        Returns:
+            Raw NewsAPI response.
+        """
+        key = hashlib.blake2b(
+            json.dumps((endpoint_name, sorted(params.items()))).encode()
+        ).hexdigest()
+        
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = self._call(getattr(self.api, endpoint_name), **params)
+        
+        if response.get('status') == 'ok':
+            # Results for a window that ended before today can no longer change
+            to_date = params.get('to')
+            fully_past = to_date is not None and to_date < datetime.now().strftime('%Y-%m-%d')
+            self.cache.set(key, response, expire=None if fully_past else CACHE_EXPIRE_SECONDS)
+            
+        return response
         
     def get_query_string(self) -> str:
         """Create a query string from keywords.
@@ -37,37 +115,59 @@ class NewsAPIWrapper:
         Returns:
             Query string for NewsAPI.
         """
-        return ' OR '.join(f'"{kw}"' for kw in self.cybersecurity_keywords)
+        return self._query_string
+    
+    def _fetch_country(self, country: str, query: str) -> List[Dict[str, Any]]:
+        """Get top cybersecurity headlines for a single country.
+        
+        Args:
+            country: Two-letter country code.
+            query: Query string for NewsAPI.
+            
+        Returns:
+            List of articles annotated with their country.
+        """
+        try:
+            top_headlines = self._cached_call(
+                'get_top_headlines',
+                q=query,
+                country=country,
+                category='technology',
+                language='de' if country in ['de', 'at', 'ch'] else 'en',
+                page_size=100
+            )
+            
+            if top_headlines['status'] == 'ok':
+                articles = top_headlines['articles']
+                for article in articles:
+                    article['country'] = country
+                return articles
+            else:
+                logger.error(f"Error fetching top headlines for {country}: {top_headlines}")
+        except Exception as e:
+            logger.error(f"Exception when fetching news for {country}: {e}")
+            
+        return []
     
     def get_dach_top_headlines(self) -> List[Dict[str, Any]]:
         """Get top cybersecurity headlines from DACH countries.
         
+        The per-country requests are network-bound, so they are issued
+        concurrently rather than one after another.
+        
         Returns:
             List of articles.
         """
         all_articles = []
         query = self.get_query_string()
         
-        for country in self.dach_countries:
-            try:
-                top_headlines = self.api.get_top_headlines(
-                    q=query,
-                    country=country,
-                    category='technology',
-                    language='de' if country in ['de', 'at', 'ch'] else 'en',
-                    page_size=100
-                )
-                
-                if top_headlines['status'] == 'ok':
-                    articles = top_headlines['articles']
-                    for article in articles:
-                        article['country'] = country
-                    all_articles.extend(articles)
-                else:
-                    print(f"Error fetching top headlines for {country}: {top_headlines}")
-            except Exception as e:
-                print(f"Exception when fetching news for {country}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=len(self.dach_countries)) as executor:
+            results = executor.map(
+                lambda country: self._fetch_country(country, query),
+                self.dach_countries
+            )
+            for articles in results:
+                all_articles.extend(articles)
                 
         return all_articles
     
@@ -81,12 +181,14 @@ class NewsAPIWrapper:
             List of articles.
         """
         query = self.get_query_string()
-        from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-        to_date = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now()
+        to_date = now.strftime('%Y-%m-%d')
+        from_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
         
         try:
             dach_domains = 'spiegel.de,faz.net,zeit.de,nzz.ch,derstandard.at,heise.de,golem.de,welt.de,sueddeutsche.de,diepresse.com,tagesanzeiger.ch'
-            all_news = self.api.get_everything(
+            all_news = self._cached_call(
+                'get_everything',
                 q=query,
                 domains=dach_domains,
                 from_param=from_date,
@@ -99,10 +201,10 @@ class NewsAPIWrapper:
             if all_news['status'] == 'ok':
                 return all_news['articles']
             else:
-                print(f"Error fetching all news: {all_news}")
+                logger.error(f"Error fetching all news: {all_news}")
                 return []
         except Exception as e:
-            print(f"Exception when fetching all news: {e}")
+            logger.error(f"Exception when fetching all news: {e}")
             return []
             
     def get_all_cybersecurity_news(self, days_back: int = 7) -> List[Dict[str, Any]]:
@@ -112,7 +214,7 @@ class NewsAPIWrapper:
             days_back: Number of days to look back for the everything endpoint.
             
         Returns:
-            Combined list of articles.
+            Combined list of articles, with duplicate URLs removed.
         """
         top_headlines = self.get_dach_top_headlines()
         everything = self.get_dach_everything(days_back=days_back)
@@ -123,5 +225,15 @@ class NewsAPIWrapper:
         
         for article in everything:
             article['api_endpoint'] = 'everything'
+        
+        # Both endpoints often return the same story; drop repeated URLs here so
+        # later stages (scraping, classification) don't process them twice
+        seen = set()
+        unique_articles = []
+        for article in top_headlines + everything:
+            url = article.get('url')
+            if url and url not in seen:
+                seen.add(url)
+                unique_articles.append(article)
             
-        return top_headlines + everything
+        return unique_articles
@@ -12,6 +12,7 @@ import os
 import sys
 import json
 import argparse
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Add the src directory to the Python path to properly resolve imports
@@ -115,7 +116,7 @@ def run_scraper(config: Dict[str, Any], display_limit: int = 5,
     Returns:
         Dictionary with paths to saved files.
     """
-    print(f"Searching for cybersecurity news from DACH region...")
+    print("Searching for cybersecurity news from DACH region...")
     print(f"Looking back {config['days_back']} days")
     
     # Initialize NewsAPI wrapper
@@ -152,8 +153,8 @@ def run_scraper(config: Dict[str, Any], display_limit: int = 5,
         print("="*80)
         
         scraper = ArticleScraper()
-        article_dicts = [article.to_dict() for article in articles]
-        relevant_articles = scraper.process_articles(article_dicts, max_articles=max_scrape)
+        article_iter = (article.to_dict() for article in articles)
+        relevant_articles = scraper.process_articles(article_iter, max_articles=max_scrape)
         
         if relevant_articles:
             # Save relevant articles
@@ -169,7 +170,8 @@ def run_scraper(config: Dict[str, Any], display_limit: int = 5,
             # Display relevant articles
             print(f"\nTop {min(display_limit, len(relevant_articles))} relevant cybersecurity articles:")
             for i, article in enumerate(relevant_articles[:display_limit], 1):
-                published = article.get('published_at', '')
+                published = article.get('published_at')
+                published = published.isoformat() if published else ''
                 source = article.get('source_name', '')
                 title = article.get('title', '')
                 url = article.get('url', '')
@@ -196,7 +198,7 @@ def run_report_generator(input_file: str = None, output_dir: str = "reports",
         generate_pdf: Whether to generate a PDF version of the report.
         
     Returns:
-        Path to the saved report file.
+        Path to the saved report file, or None if no input data was found.
     """
     # Get input file path if not provided
     if not input_file:
@@ -207,15 +209,23 @@ def run_report_generator(input_file: str = None, output_dir: str = "reports",
     print(f"Using data from: {input_file}")
     
     # Load articles
-    articles = load_articles(input_file)
+    try:
+        articles = load_articles(input_file)
+    except FileNotFoundError:
+        print(f"Error: File {input_file} not found.")
+        return None
     print(f"Loaded {len(articles)} articles")
     
-    # Generate report
+    # Generate report, streaming the markdown to disk as it is produced
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    md_path = os.path.join(output_dir, f"cybersecurity_report_{timestamp}.md")
+    
     print(f"Generating report using {model}...")
-    report = generate_report(articles, model_name=model)
+    report = generate_report(articles, model_name=model, out_path=md_path)
     
     # Save report
-    output_path = save_report(report, output_dir=output_dir, generate_pdf=generate_pdf)
+    output_path = save_report(report, output_dir=output_dir, generate_pdf=generate_pdf, md_path=md_path)
     print(f"Report saved to: {output_path}")
     
     # Print the first few lines of the report
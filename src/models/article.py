@@ -5,31 +5,78 @@
 Article data model for NewsAPI responses.
 """
 
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to per-article parsing
+    np = None
 
+# NewsAPI's usual date format, which numpy parses exactly. Fractional seconds
+# would be silently truncated and UTC offsets only trigger a warning.
+_PLAIN_DATE_RE = re.compile(r'(?!0000)\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z')
+
+
+@dataclass(slots=True, eq=False)
 class Article:
-    """Data model for a news article."""
+    """Data model for a news article.
+    
+    Articles are dataclasses, so orjson serializes them directly without
+    going through to_dict.
+    """
     
-    def __init__(self, data: Dict[str, Any]):
-        """Initialize article from NewsAPI data.
+    source_name: Optional[str] = ''
+    author: Optional[str] = ''
+    title: Optional[str] = ''
+    description: Optional[str] = ''
+    url: Optional[str] = ''
+    url_to_image: Optional[str] = ''
+    published_at: Optional[datetime] = None
+    content: Optional[str] = ''
+    country: Optional[str] = ''
+    api_endpoint: Optional[str] = ''
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Article':
+        """Create an article from NewsAPI data.
         
         Args:
             data: Raw article data from NewsAPI.
+            
+        Returns:
+            Article object.
         """
-        self.source_name = data.get('source', {}).get('name', '')
-        self.author = data.get('author', '')
-        self.title = data.get('title', '')
-        self.description = data.get('description', '')
-        self.url = data.get('url', '')
-        self.url_to_image = data.get('urlToImage', '')
-        self.published_at = self._parse_date(data.get('publishedAt', ''))
-        self.content = data.get('content', '')
-        self.country = data.get('country', '')
-        self.api_endpoint = data.get('api_endpoint', '')
-        
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
+        return cls._from_raw(data, cls._parse_date(data.get('publishedAt', '')))
+        
+    @classmethod
+    def _from_raw(cls, data: Dict[str, Any], published_at: Optional[datetime]) -> 'Article':
+        """Create an article from NewsAPI data and an already parsed date.
+        
+        Args:
+            data: Raw article data from NewsAPI.
+            published_at: Already parsed publication date.
+            
+        Returns:
+            Article object.
+        """
+        return cls(
+            source_name=data.get('source', {}).get('name', ''),
+            author=data.get('author', ''),
+            title=data.get('title', ''),
+            description=data.get('description', ''),
+            url=data.get('url', ''),
+            url_to_image=data.get('urlToImage', ''),
+            published_at=published_at,
+            content=data.get('content', ''),
+            country=data.get('country', ''),
+            api_endpoint=data.get('api_endpoint', ''),
+        )
+        
+    @staticmethod
+    def _parse_date(date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object.
         
         Args:
@@ -59,11 +106,83 @@ class Article:
         Returns:
             List of Article objects.
         """
-        return [cls(article) for article in articles_data]
+        # Parse the whole publishedAt column at once instead of per article
+        parsed = cls._parse_dates_array([article.get('publishedAt', '') for article in articles_data])
+        if parsed is None:
+            return [cls.from_dict(article) for article in articles_data]
+        
+        return [
+            cls._from_raw(data, published_at.replace(tzinfo=timezone.utc) if published_at else None)
+            for data, published_at in zip(articles_data, parsed.tolist())
+        ]
+    
+    @staticmethod
+    def _parse_dates_array(date_strs: List[Optional[str]]) -> Any:
+        """Parse a column of NewsAPI dates into a numpy datetime64 array in one call.
+        
+        Only dates in the plain 'YYYY-MM-DDTHH:MM:SSZ' format are parsed in
+        bulk; anything else must go through _parse_date to get the same result.
+        
+        Args:
+            date_strs: Date strings from NewsAPI.
+            
+        Returns:
+            Array of datetime64[s] values (NaT where missing), or None if numpy
+            is not installed or some dates are not in the plain format.
+        """
+        if np is None:
+            return None
+        
+        values = []
+        for d in date_strs:
+            if not d:
+                values.append(None)
+            elif isinstance(d, str) and _PLAIN_DATE_RE.fullmatch(d):
+                values.append(d[:-1])
+            else:
+                return None
+        
+        try:
+            return np.array(values, dtype='datetime64[s]')
+        except ValueError:
+            # Out-of-range fields, e.g. month 13
+            return None
+    
+    @classmethod
+    def from_api_response_soa(cls, articles_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create a column-oriented (dict of lists) view of a NewsAPI response.
+        
+        Args:
+            articles_data: List of article dictionaries from NewsAPI.
+            
+        Returns:
+            Dictionary mapping field names to columns. ``published_at`` is a
+            numpy datetime64 array when numpy is installed and all dates are
+            in the plain format, otherwise a list of datetime objects.
+        """
+        dates = [article.get('publishedAt', '') for article in articles_data]
+        published_at = cls._parse_dates_array(dates)
+        if published_at is None:
+            published_at = [cls._parse_date(d) for d in dates]
+        return {
+            'source_name': [article.get('source', {}).get('name', '') for article in articles_data],
+            'author': [article.get('author', '') for article in articles_data],
+            'title': [article.get('title', '') for article in articles_data],
+            'description': [article.get('description', '') for article in articles_data],
+            'url': [article.get('url', '') for article in articles_data],
+            'url_to_image': [article.get('urlToImage', '') for article in articles_data],
+            'published_at': published_at,
+            'content': [article.get('content', '') for article in articles_data],
+            'country': [article.get('country', '') for article in articles_data],
+            'api_endpoint': [article.get('api_endpoint', '') for article in articles_data],
+        }
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Article to dictionary.
         
+        ``published_at`` is kept as a datetime; it is formatted when the
+        dictionary is serialized.
+        
         Returns:
             Dictionary representation of the article.
         """
@@ -74,12 +193,25 @@ class Article:
             'description': self.description,
             'url': self.url,
             'url_to_image': self.url_to_image,
-            'published_at': self.published_at.isoformat() if self.published_at else None,
+            'published_at': self.published_at,
             'content': self.content,
             'country': self.country,
             'api_endpoint': self.api_endpoint,
         }
     
+    def to_row(self) -> Tuple[Any, ...]:
+        """Convert Article to a tuple of its fields, in declaration order.
+        
+        Cheaper to build than to_dict; used for tabular output.
+        
+        Returns:
+            Tuple with one value per field.
+        """
+        return (
+            self.source_name, self.author, self.title, self.description, self.url,
+            self.url_to_image, self.published_at, self.content, self.country, self.api_endpoint,
+        )
+    
     def __str__(self) -> str:
         """String representation of the article.
         
@@ -8,24 +8,42 @@ This module takes NewsAPI data about cybersecurity incidents and uses OpenAI via
 to generate a comprehensive report about the incidents.
 """
 
+import asyncio
+import functools
+import io
 import os
-import json
-from typing import Dict, List, Any, Optional
+import stat
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from datetime import datetime
+from pathlib import Path
 
 from dotenv import load_dotenv
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
 
-# Load environment variables
-load_dotenv()
+from src.utils import fastjson
 
-# Make sure OpenAI API key is available
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    print("Error: OPENAI_API_KEY not found in environment variables.")
-    print("Please add OPENAI_API_KEY to your .env file.")
+# LangChain is imported lazily inside the functions that need it, so
+# importing this module (e.g. for --help or scraping only) stays cheap
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_openai import ChatOpenAI
+
+
+@functools.cache
+def _get_openai_api_key() -> Optional[str]:
+    """Load environment variables and return the OpenAI API key.
+    
+    Returns:
+        OpenAI API key, or None if it is not configured.
+    """
+    load_dotenv()
+    
+    # Make sure OpenAI API key is available
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("Error: OPENAI_API_KEY not found in environment variables.")
+        print("Please add OPENAI_API_KEY to your .env file.")
+    
+    return api_key
 
 
 def load_articles(file_path: str) -> List[Dict[str, Any]]:
@@ -36,13 +54,15 @@ def load_articles(file_path: str) -> List[Dict[str, Any]]:
         
     Returns:
         List of article dictionaries.
+        
+    Raises:
+        FileNotFoundError: If the file does not exist.
     """
     if not os.path.exists(file_path):
-        print(f"Error: File {file_path} not found.")
-        exit(1)
+        raise FileNotFoundError(file_path)
         
-    with open(file_path, 'r', encoding='utf-8') as f:
-        articles = json.load(f)
+    with open(file_path, 'rb') as f:
+        articles = fastjson.loads(f.read())
     
     return articles
 
@@ -57,57 +77,32 @@ def get_latest_data_file(data_dir: str = "data", file_type: str = "json") -> Opt
     Returns:
         Path to the most recent file, or None if no files found.
     """
-    if not os.path.exists(data_dir):
+    data_path = Path(data_dir)
+    if not data_path.is_dir():
         print(f"Error: Directory {data_dir} not found.")
         return None
     
-    # Get all files with the specified extension
-    files = [f for f in os.listdir(data_dir) if f.endswith(f".{file_type}")]
+    # Path objects already hold the full path, so no path strings are rebuilt
+    # while searching for the newest one. Each candidate is stat'ed once, both
+    # to skip directories matching the pattern and to get its mtime.
+    candidates = []
+    for f in data_path.glob(f"*.{file_type}"):
+        try:
+            st = f.stat()
+        except OSError:  # e.g. a broken symlink
+            continue
+        if stat.S_ISREG(st.st_mode):
+            candidates.append((st.st_mtime, f))
     
-    if not files:
+    if not candidates:
         print(f"Error: No {file_type} files found in {data_dir}.")
         return None
     
-    # Sort by modification time (newest first)
-    files.sort(key=lambda x: os.path.getmtime(os.path.join(data_dir, x)), reverse=True)
-    
-    return os.path.join(data_dir, files[0])
+    return str(max(candidates, key=lambda c: c[0])[1])
 
 
-def generate_report(articles: List[Dict[str, Any]], model_name: str = "gpt-4o-mini") -> str:
-    """Generate a cybersecurity report from articles using OpenAI.
-    
-    Args:
-        articles: List of article dictionaries.
-        model_name: OpenAI model to use.
-        
-    Returns:
-        Generated report text.
-    """
-    if not OPENAI_API_KEY:
-        return "Error: OpenAI API key not available. Cannot generate report."
-        
-    # Prepare a concise version of the articles for context
-    article_summaries = []
-    for i, article in enumerate(articles[:30], 1):  # Limit to top 30 articles
-        published = article.get('published_at', '')
-        source = article.get('source_name', '')
-        title = article.get('title', '')
-        description = article.get('description', '')
-        url = article.get('url', '')
-        
-        # Include content excerpt if available (from scraping)
-        content_excerpt = ""
-        if article.get('content'):
-            content = article['content']
-            content_excerpt = f"\n   Content: {content[:200]}..." if len(content) > 200 else f"\n   Content: {content}"
-        
-        article_summaries.append(f"{i}. {title}\n   Published: {published} by {source}\n   {description}{content_excerpt}\n   URL: {url}\n")
-    
-    article_context = "\n".join(article_summaries)
-    
-    # Create a prompt template
-    prompt_template = """
+# Prompt used to turn the article summaries into the final report
+_PROMPT = """
     You are a cybersecurity analyst tasked with creating a comprehensive report about recent cybersecurity incidents and trends in the DACH region (Germany, Austria, Switzerland).
 
     Below are recent news articles about cybersecurity from the DACH region:
@@ -128,32 +123,170 @@ def generate_report(articles: List[Dict[str, Any]], model_name: str = "gpt-4o-mi
     REPORT:
     """
 
-    # Create prompt from template
-    prompt = PromptTemplate.from_template(prompt_template)
+# Maximum number of concurrent per-article summary requests to OpenAI
+SUMMARY_CONCURRENCY = 10
+
+
+@functools.lru_cache(maxsize=4)
+def _get_chain(model_name: str) -> 'Runnable':
+    """Get the report generation chain for a model, creating it on first use.
+    
+    Args:
+        model_name: OpenAI model to use.
+        
+    Returns:
+        Chain producing the report from the article context.
+    """
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import PromptTemplate
+    from langchain_openai import ChatOpenAI
+    
+    llm = ChatOpenAI(model=model_name, temperature=0.3, api_key=_get_openai_api_key())
+    prompt = PromptTemplate.from_template(_PROMPT)
+    return prompt | llm | StrOutputParser()
+
+
+async def _summarize(llm: 'ChatOpenAI', article: Dict[str, Any], semaphore: asyncio.Semaphore) -> str:
+    """Summarize a single article in two sentences.
+    
+    Args:
+        llm: Chat model to use.
+        article: Article dictionary.
+        semaphore: Semaphore bounding the number of in-flight requests.
+        
+    Returns:
+        Summary text.
+    """
+    content = article.get('content') or article.get('description') or ''
+    prompt = (
+        "Summarize the following cybersecurity news article in at most two sentences. "
+        "Mention affected organizations, the type of incident and the country if known.\n\n"
+        f"Title: {article.get('title') or ''}\n\n"
+        f"{content[:4000]}"
+    )
+    
+    async with semaphore:
+        message = await llm.ainvoke(prompt)
+    
+    return message.content.strip()
+
+
+async def _summarize_articles(articles: List[Dict[str, Any]], model_name: str) -> List[Any]:
+    """Summarize articles concurrently.
+    
+    Args:
+        articles: List of article dictionaries.
+        model_name: OpenAI model to use.
+        
+    Returns:
+        One summary per article, or the exception raised while summarizing it.
+    """
+    from langchain_openai import ChatOpenAI
+    
+    # Not cached like the report chain: the async client is tied to the event
+    # loop created by asyncio.run, which is closed after every report.
+    llm = ChatOpenAI(model=model_name, temperature=0.3, api_key=_get_openai_api_key())
+    semaphore = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+    return await asyncio.gather(
+        *[_summarize(llm, article, semaphore) for article in articles],
+        return_exceptions=True
+    )
+
+
+def generate_report(articles: List[Dict[str, Any]], model_name: str = "gpt-4o-mini",
+                    out_path: Optional[str] = None) -> str:
+    """Generate a cybersecurity report from articles using OpenAI.
+    
+    Each article is first summarized with its own, concurrently issued request;
+    the summaries are then combined into the final report in a single call.
+    
+    Args:
+        articles: List of article dictionaries.
+        model_name: OpenAI model to use.
+        out_path: Optional markdown file to stream the report into while it
+            is being generated.
+        
+    Returns:
+        Generated report text.
+    """
+    if not _get_openai_api_key():
+        return "Error: OpenAI API key not available. Cannot generate report."
+    
+    articles = articles[:30]  # Limit to top 30 articles
     
     try:
-        # Initialize the OpenAI model
-        llm = ChatOpenAI(model=model_name, temperature=0.3, api_key=OPENAI_API_KEY)
+        summaries = asyncio.run(_summarize_articles(articles, model_name))
+    except Exception as e:
+        print(f"Error summarizing articles: {e}")
+        summaries = [e] * len(articles)
+    
+    failed = sum(1 for summary in summaries if not isinstance(summary, str))
+    if failed:
+        print(f"Warning: Could not summarize {failed} of {len(articles)} articles, using their descriptions instead.")
         
-        # Create a chain
-        chain = LLMChain(llm=llm, prompt=prompt)
+    # Prepare a concise version of the articles for context, truncating long
+    # fields so scraped articles don't bloat the prompt
+    buf = io.StringIO()
+    for i, (article, summary) in enumerate(zip(articles, summaries), 1):
+        published = article.get('published_at', '')
+        source = article.get('source_name', '')
+        title = article.get('title') or ''
+        url = article.get('url', '')
         
-        # Generate the report
-        report = chain.run(article_context=article_context)
+        if i > 1:
+            buf.write("\n")
+        buf.write(f"{i}. {title[:200]}\n   Published: {published} by {source}")
         
-        return report
+        if isinstance(summary, str):
+            buf.write(f"\n   Summary: {summary}")
+        else:
+            # Fall back to the raw description and content excerpt
+            description = article.get('description') or ''
+            buf.write(f"\n   {description[:300]}")
+            content = article.get('content')
+            if content:
+                buf.write(f"\n   Content: {content[:200]}..." if len(content) > 200 else f"\n   Content: {content}")
+        
+        buf.write(f"\n   URL: {url}\n")
+    
+    article_context = buf.getvalue()
+    
+    inputs = {"article_context": article_context}
+    
+    try:
+        chain = _get_chain(model_name)
+        
+        if out_path is None:
+            return chain.invoke(inputs)
+        
+        # Write chunks to disk as they arrive, keeping a copy for the PDF step
+        parts = []
+        with open(out_path, 'w', encoding='utf-8') as f:
+            for chunk in chain.stream(inputs):
+                f.write(chunk)
+                parts.append(chunk)
+        
+        return ''.join(parts)
     except Exception as e:
         print(f"Error generating report: {e}")
-        return f"Error generating report: {str(e)}"
+        report = f"Error generating report: {str(e)}"
+        if out_path is not None:
+            with open(out_path, 'w', encoding='utf-8') as f:
+                f.write(report)
+        return report
 
 
-def save_report(report: str, output_dir: str = "reports", generate_pdf: bool = True) -> str:
+def save_report(report: str, output_dir: str = "reports", generate_pdf: bool = True,
+                md_path: Optional[str] = None) -> str:
     """Save the generated report to PDF file, using markdown as an intermediate format.
     
     Args:
         report: Report text.
         output_dir: Directory to save the report.
         generate_pdf: Whether to generate a PDF version.
+        md_path: Markdown file the report was already streamed to by
+            generate_report. It is reused instead of writing a new one, and
+            the PDF is placed next to it.
         
     Returns:
         Path to the saved PDF file (or markdown if PDF generation fails).
@@ -169,8 +302,11 @@ def save_report(report: str, output_dir: str = "reports", generate_pdf: bool = T
         try:
             from src.report.pdf_generator import convert_markdown_to_pdf
             
-            pdf_filename = f"cybersecurity_report_{timestamp}.pdf"
-            pdf_path = os.path.join(output_dir, pdf_filename)
+            if md_path:
+                pdf_path = os.path.splitext(md_path)[0] + '.pdf'
+            else:
+                pdf_filename = f"cybersecurity_report_{timestamp}.pdf"
+                pdf_path = os.path.join(output_dir, pdf_filename)
             
             pdf_result = convert_markdown_to_pdf(
                 report, 
@@ -191,8 +327,12 @@ def save_report(report: str, output_dir: str = "reports", generate_pdf: bool = T
             print(f"Error generating PDF: {str(e)}")
     
     # Save markdown if PDF generation is disabled or failed
-    md_filename = f"cybersecurity_report_{timestamp}.md"
-    md_path = os.path.join(output_dir, md_filename)
+    if md_path and os.path.exists(md_path):
+        return md_path
+    
+    if not md_path:
+        md_filename = f"cybersecurity_report_{timestamp}.md"
+        md_path = os.path.join(output_dir, md_filename)
     
     with open(md_path, 'w', encoding='utf-8') as f:
         f.write(report)
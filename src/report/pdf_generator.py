@@ -7,123 +7,199 @@ PDF Report Generator
 This module converts the markdown report to a PDF document using a more reliable approach.
 """
 
+import hashlib
 import os
+import re
+import shutil
+import string
 import subprocess
 import tempfile
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
+
+# Conversion results are cached here, keyed by a hash of their inputs
+CACHE_DIR = os.path.expanduser('~/.cache/newsapi/md2html')
+# Maximum number of cached conversions; the least recently used are evicted
+CACHE_MAX_ENTRIES = 256
 
 # Simple HTML template for the report
-HTML_TEMPLATE = """
+HTML_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{title}</title>
+    <title>$title</title>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             line-height: 1.6;
             margin: 40px;
             max-width: 900px;
             margin: 0 auto;
             padding: 20px;
-        }}
-        h1 {{
+        }
+        h1 {
             color: #1a66c2;
             border-bottom: 1px solid #ddd;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #1a66c2;
             margin-top: 30px;
-        }}
-        h3 {{
+        }
+        h3 {
             color: #333;
             margin-top: 25px;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 40px;
-        }}
-        .title {{
+        }
+        .title {
             font-size: 28px;
             font-weight: bold;
-        }}
-        .subtitle {{
+        }
+        .subtitle {
             font-size: 20px;
             color: #666;
             margin-top: 10px;
-        }}
-        .date {{
+        }
+        .date {
             font-size: 14px;
             color: #666;
             margin-top: 20px;
-        }}
-        .content {{
+        }
+        .content {
             margin-top: 30px;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             margin-top: 50px;
             color: #666;
             font-size: 12px;
             border-top: 1px solid #ddd;
             padding-top: 10px;
-        }}
-        pre {{
+        }
+        pre {
             background-color: #f5f5f5;
             padding: 10px;
             border-radius: 5px;
             overflow-x: auto;
-        }}
-        code {{
+        }
+        code {
             background-color: #f5f5f5;
             padding: 2px 4px;
             border-radius: 3px;
-        }}
-        blockquote {{
+        }
+        blockquote {
             border-left: 4px solid #1a66c2;
             padding-left: 15px;
             margin-left: 0;
             color: #555;
-        }}
-        table {{
+        }
+        table {
             border-collapse: collapse;
             width: 100%;
             margin: 20px 0;
-        }}
-        th, td {{
+        }
+        th, td {
             border: 1px solid #ddd;
             padding: 8px;
             text-align: left;
-        }}
-        th {{
+        }
+        th {
             background-color: #f2f2f2;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="header">
-        <div class="title">{title}</div>
+        <div class="title">$title</div>
         <div class="subtitle">Cybersecurity Intelligence Report</div>
-        <div class="date">Generated on {date}</div>
+        <div class="date">Generated on $date</div>
     </div>
     
     <div class="content">
-        {content}
+        $content
     </div>
     
     <div class="footer">
-        <p>Generated on {date} | Confidential</p>
+        <p>Generated on $date | Confidential</p>
     </div>
 </body>
 </html>
-"""
+""")
+
+# One alternative per line type handled by simple_markdown_to_html:
+# header (# to ###), list item, code fence, blank line, anything else
+MARKDOWN_LINE_PATTERN = re.compile(r'^(?:(#{1,3}) (.*)|- (.*)|(```.*)|([^\S\n]*)|(.*))$', re.M)
+
+def _cache_key(*parts: str) -> str:
+    """Build a cache key from the inputs of a conversion.
+    
+    Args:
+        *parts: Strings that fully determine the conversion output.
+        
+    Returns:
+        Hex digest identifying the conversion.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def _cache_lookup(key: str, extension: str) -> Optional[str]:
+    """Find a cached conversion result.
+    
+    Args:
+        key: Cache key from _cache_key.
+        extension: File extension of the result, e.g. '.html'.
+        
+    Returns:
+        Path to the cached file, or None on a cache miss.
+    """
+    path = os.path.join(CACHE_DIR, f"{key}{extension}")
+    if not os.path.exists(path):
+        return None
+    
+    try:
+        os.utime(path)  # Mark as recently used for eviction
+    except OSError:
+        pass
+    return path
+
+def _cache_store(key: str, extension: str, data: bytes) -> None:
+    """Write a conversion result into the cache, evicting old entries if needed.
+    
+    Args:
+        key: Cache key from _cache_key.
+        extension: File extension of the result, e.g. '.html'.
+        data: Content of the conversion result.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        
+        # Write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, os.path.join(CACHE_DIR, f"{key}{extension}"))
+        
+        entries = [e for e in os.scandir(CACHE_DIR) if e.is_file() and not e.name.endswith('.tmp')]
+        if len(entries) > CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+                os.unlink(entry.path)
+    except OSError as e:
+        print(f"Warning: Could not cache conversion result: {e}")
 
 def convert_markdown_to_html(markdown_text: str, title: str = "Cybersecurity Report") -> str:
     """Convert markdown to HTML with simple styling.
     
+    Results are cached on disk, so converting the same report again does
+    not re-run pandoc.
+    
     Args:
         markdown_text: Markdown content of the report.
         title: Title of the report.
@@ -131,68 +207,67 @@ def convert_markdown_to_html(markdown_text: str, title: str = "Cybersecurity Rep
     Returns:
         HTML content.
     """
+    # Format the date
+    date = datetime.now().strftime("%B %d, %Y")
+    
+    cache_key = _cache_key(markdown_text, title, date, HTML_TEMPLATE.template)
+    cached_path = _cache_lookup(cache_key, '.html')
+    if cached_path:
+        with open(cached_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    used_pandoc = False
     try:
-        # Use pandoc to convert markdown to HTML if available
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as temp_md:
-            temp_md_path = temp_md.name
-            temp_md.write(markdown_text)
-        
-        with tempfile.NamedTemporaryFile(mode='r', delete=False, suffix='.html') as temp_html:
-            temp_html_path = temp_html.name
-        
-        try:
-            subprocess.run(['pandoc', temp_md_path, '-o', temp_html_path], check=True)
-            with open(temp_html_path, 'r') as f:
-                html_content = f.read()
-        except (subprocess.SubprocessError, FileNotFoundError):
-            # Fallback to simple conversion if pandoc isn't available
-            print("Pandoc not available, using simple markdown to HTML conversion")
-            html_content = simple_markdown_to_html(markdown_text)
+        # Use pandoc to convert markdown to HTML if available, piping the
+        # markdown in and the HTML out
+        result = subprocess.run(['pandoc', '-f', 'markdown', '-t', 'html'],
+                                input=markdown_text.encode('utf-8'), capture_output=True, check=True)
+        html_content = result.stdout.decode('utf-8')
+        used_pandoc = True
+    except (subprocess.SubprocessError, FileNotFoundError):
+        # Fallback to simple conversion if pandoc isn't available
+        print("Pandoc not available, using simple markdown to HTML conversion")
+        html_content = simple_markdown_to_html(markdown_text)
     except Exception as e:
         print(f"Error converting markdown to HTML: {e}")
         html_content = f"<pre>{markdown_text}</pre>"  # Fallback to just showing the markdown
-    finally:
-        # Clean up temporary files
-        if 'temp_md_path' in locals() and os.path.exists(temp_md_path):
-            os.unlink(temp_md_path)
-        if 'temp_html_path' in locals() and os.path.exists(temp_html_path):
-            os.unlink(temp_html_path)
-    
-    # Format the date
-    date = datetime.now().strftime("%B %d, %Y")
     
     # Insert the HTML content into the template
-    full_html = HTML_TEMPLATE.format(
+    full_html = HTML_TEMPLATE.substitute(
         title=title,
         date=date,
         content=html_content
     )
     
+    # Only cache pandoc output; the fallbacks are cheap and pandoc may be
+    # installed later
+    if used_pandoc:
+        _cache_store(cache_key, '.html', full_html.encode('utf-8'))
+    
     return full_html
 
 def simple_markdown_to_html(markdown_text: str) -> str:
     """Simple markdown to HTML conversion for basic formatting."""
-    lines = markdown_text.split('\n')
     html_lines = []
     in_list = False
     in_code_block = False
     
-    for line in lines:
+    # The regex engine classifies each line; only the state machine runs in Python
+    for match in MARKDOWN_LINE_PATTERN.finditer(markdown_text):
+        hashes, header, list_item, code_fence, blank, line = match.groups()
+        
         # Handle headers
-        if line.startswith('# '):
-            html_lines.append(f'<h1>{line[2:]}</h1>')
-        elif line.startswith('## '):
-            html_lines.append(f'<h2>{line[3:]}</h2>')
-        elif line.startswith('### '):
-            html_lines.append(f'<h3>{line[4:]}</h3>')
+        if hashes is not None:
+            level = len(hashes)
+            html_lines.append(f'<h{level}>{header}</h{level}>')
         # Handle lists
-        elif line.startswith('- '):
+        elif list_item is not None:
             if not in_list:
                 html_lines.append('<ul>')
                 in_list = True
-            html_lines.append(f'<li>{line[2:]}</li>')
+            html_lines.append(f'<li>{list_item}</li>')
         # Handle code blocks
-        elif line.startswith('```'):
+        elif code_fence is not None:
             if in_code_block:
                 html_lines.append('</pre>')
                 in_code_block = False
@@ -200,7 +275,7 @@ def simple_markdown_to_html(markdown_text: str) -> str:
                 html_lines.append('<pre><code>')
                 in_code_block = True
         # Handle paragraphs
-        elif line.strip() == '':
+        elif blank is not None:
             if in_list:
                 html_lines.append('</ul>')
                 in_list = False
@@ -228,20 +303,21 @@ def convert_html_to_pdf(html_content: str, output_path: str) -> Optional[str]:
     # Create the output directory if it doesn't exist
     os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
     
-    # Write the HTML to a temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_html:
-        temp_html_path = temp_html.name
-        temp_html.write(html_content)
-    
     try:
-        # Try wkhtmltopdf
+        # Try wkhtmltopdf, piping the HTML through stdin
         try:
-            subprocess.run(['wkhtmltopdf', temp_html_path, output_path], check=True)
+            subprocess.run(['wkhtmltopdf', '-', output_path],
+                           input=html_content.encode('utf-8'), check=True)
             print(f"Generated PDF using wkhtmltopdf: {output_path}")
             return output_path
         except (subprocess.SubprocessError, FileNotFoundError):
             print("wkhtmltopdf not available, trying Google Chrome")
             
+            # The remaining tools only read from files, so write the HTML out
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_html:
+                temp_html_path = temp_html.name
+                temp_html.write(html_content)
+            
             # Try Chrome/Chromium headless
             try:
                 for chrome_cmd in ['google-chrome', 'chrome', 'chromium', 'chromium-browser']:
@@ -278,14 +354,12 @@ def convert_html_to_pdf(html_content: str, output_path: str) -> Optional[str]:
                     except (subprocess.SubprocessError, FileNotFoundError):
                         # Save as HTML and inform the user
                         html_output = output_path.replace('.pdf', '.html')
-                        import shutil
                         shutil.copy2(temp_html_path, html_output)
                         print(f"Could not generate PDF. HTML saved to {html_output}")
                         return None
                 else:
                     # Save as HTML and inform the user
                     html_output = output_path.replace('.pdf', '.html')
-                    import shutil
                     shutil.copy2(temp_html_path, html_output)
                     print(f"Could not generate PDF. HTML saved to {html_output}")
                     return None
@@ -296,12 +370,152 @@ def convert_html_to_pdf(html_content: str, output_path: str) -> Optional[str]:
     
     finally:
         # Clean up the temporary HTML file
-        if os.path.exists(temp_html_path):
+        if 'temp_html_path' in locals() and os.path.exists(temp_html_path):
             os.unlink(temp_html_path)
 
+def _pdf_cache_key(markdown_text: str, output_path: str, title: str) -> Tuple[str, str]:
+    """Build the cache key and file extension for a PDF conversion.
+    
+    Args:
+        markdown_text: Markdown content of the report.
+        output_path: Path to save the PDF file.
+        title: Title of the report.
+        
+    Returns:
+        Tuple of (cache key, file extension).
+    """
+    date = datetime.now().strftime("%B %d, %Y")
+    extension = os.path.splitext(output_path)[1] or '.pdf'
+    return _cache_key(markdown_text, title, date, HTML_TEMPLATE.template, extension), extension
+
+def _restore_cached_pdf(cache_key: str, extension: str, output_path: str) -> bool:
+    """Copy a cached PDF to the output path if there is one.
+    
+    Args:
+        cache_key: Cache key from _pdf_cache_key.
+        extension: File extension from _pdf_cache_key.
+        output_path: Path to save the PDF file.
+        
+    Returns:
+        Whether a cached PDF was found and copied.
+    """
+    cached_path = _cache_lookup(cache_key, extension)
+    if not cached_path:
+        return False
+    
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    shutil.copyfile(cached_path, output_path)
+    print(f"Reused cached PDF: {output_path}")
+    return True
+
+def _store_cached_pdf(cache_key: str, extension: str, output_path: str) -> None:
+    """Add a generated PDF to the cache.
+    
+    Args:
+        cache_key: Cache key from _pdf_cache_key.
+        extension: File extension from _pdf_cache_key.
+        output_path: Path of the generated PDF file.
+    """
+    with open(output_path, 'rb') as f:
+        _cache_store(cache_key, extension, f.read())
+
 def convert_markdown_to_pdf(markdown_text: str, output_path: str, title: str = "Cybersecurity Report") -> Optional[str]:
     """Convert markdown report to PDF using available system tools.
     
+    Generated PDFs are cached on disk, keyed by the report content.
+    
+    Args:
+        markdown_text: Markdown content of the report.
+        output_path: Path to save the PDF file.
+        title: Title of the report.
+        
+    Returns:
+        Path to the saved PDF file, or None if conversion failed.
+    """
+    cache_key, extension = _pdf_cache_key(markdown_text, output_path, title)
+    if _restore_cached_pdf(cache_key, extension, output_path):
+        return output_path
+    
+    result = _convert_markdown_to_pdf(markdown_text, output_path, title)
+    if result:
+        _store_cached_pdf(cache_key, extension, result)
+    return result
+
+def convert_markdown_to_pdfs(items: List[Tuple[str, str, str]]) -> List[Optional[str]]:
+    """Convert several markdown reports to PDF, running pandoc in parallel.
+    
+    Up to one pandoc process per CPU core runs at a time. Reports pandoc
+    fails on are converted through HTML one by one, like in
+    convert_markdown_to_pdf.
+    
+    Args:
+        items: (markdown text, output path, title) of each report.
+        
+    Returns:
+        Path to each saved PDF file, or None where conversion failed, in
+        the order of items.
+    """
+    results: List[Optional[str]] = [None] * len(items)
+    
+    pending = []
+    for i, (markdown_text, output_path, title) in enumerate(items):
+        cache_key, extension = _pdf_cache_key(markdown_text, output_path, title)
+        if _restore_cached_pdf(cache_key, extension, output_path):
+            results[i] = output_path
+        else:
+            pending.append((i, markdown_text, output_path, title, cache_key, extension))
+    
+    workers = min(len(pending), os.cpu_count() or 1)
+    pandoc_available = True
+    for start in range(0, len(pending), workers or 1):
+        window = pending[start:start + workers]
+        
+        # Start all processes of the window before waiting on any of them
+        processes = []
+        for _, markdown_text, output_path, _, _, _ in window:
+            process = None
+            if pandoc_available:
+                os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+                try:
+                    process = subprocess.Popen(['pandoc', '-f', 'markdown', '-o', output_path],
+                                               stdin=subprocess.PIPE)
+                except FileNotFoundError:
+                    pandoc_available = False
+                except OSError as e:
+                    print(f"Error running pandoc for {output_path}: {e}")
+                else:
+                    try:
+                        process.stdin.write(markdown_text.encode('utf-8'))
+                        process.stdin.close()
+                    except OSError as e:
+                        # Includes BrokenPipeError if pandoc exited early;
+                        # reap the process instead of leaving a zombie
+                        print(f"Error running pandoc for {output_path}: {e}")
+                        process.kill()
+                        process.wait()
+                        process = None
+            processes.append(process)
+        
+        for (i, markdown_text, output_path, title, cache_key, extension), process in zip(window, processes):
+            if process is not None and process.wait() == 0:
+                print(f"Generated PDF using pandoc: {output_path}")
+                results[i] = output_path
+            else:
+                print("Pandoc PDF generation not available, trying HTML conversion first")
+                try:
+                    html_content = convert_markdown_to_html(markdown_text, title)
+                    results[i] = convert_html_to_pdf(html_content, output_path)
+                except Exception as e:
+                    print(f"Error generating PDF: {e}")
+            
+            if results[i]:
+                _store_cached_pdf(cache_key, extension, results[i])
+    
+    return results
+
+def _convert_markdown_to_pdf(markdown_text: str, output_path: str, title: str) -> Optional[str]:
+    """Convert markdown report to PDF, without consulting the cache.
+    
     Args:
         markdown_text: Markdown content of the report.
         output_path: Path to save the PDF file.
@@ -316,13 +530,9 @@ def convert_markdown_to_pdf(markdown_text: str, output_path: str, title: str = "
             # Create the output directory if it doesn't exist
             os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
             
-            # Create a temporary markdown file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as temp_md:
-                temp_md_path = temp_md.name
-                temp_md.write(markdown_text)
-            
-            # Try pandoc with PDF output
-            subprocess.run(['pandoc', temp_md_path, '-o', output_path], check=True)
+            # Try pandoc with PDF output, feeding the markdown through stdin
+            subprocess.run(['pandoc', '-f', 'markdown', '-o', output_path],
+                           input=markdown_text.encode('utf-8'), check=True)
             print(f"Generated PDF using pandoc: {output_path}")
             return output_path
         
@@ -8,19 +8,32 @@ This module scrapes the full content of articles from their URLs
 and uses OpenAI to classify if they're relevant to cybersecurity in the DACH region.
 """
 
+import codecs
 import os
 import time
-import json
 import random
+import asyncio
+import functools
+import hashlib
+import re
+import itertools
+import threading
 import requests
-from typing import Dict, List, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Any, Optional, Sized, Tuple
 from datetime import datetime
+from pathlib import Path
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import lxml.html
 from dotenv import load_dotenv
+from lxml import etree
 from openai import OpenAI
 
+from src.utils import fastjson
+
 # Load environment variables
 load_dotenv()
 
@@ -31,14 +44,113 @@ if not OPENAI_API_KEY:
     print("Article classification will not work without an OpenAI API key.")
 
 
+def _class_xpath(tag: str, class_name: str) -> str:
+    """Build an XPath expression matching elements that have a CSS class.
+    
+    Args:
+        tag: Element tag, or '*' for any element.
+        class_name: Class the element must have.
+        
+    Returns:
+        XPath expression selecting the matching elements.
+    """
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+# Selectors for the article body of known DACH news sites, tried in order
+DOMAIN_RULES = {
+    "heise.de": [etree.XPath("//article"), etree.XPath(_class_xpath("div", "article-content"))],
+    "zeit.de": [etree.XPath(_class_xpath("div", "article-body")), etree.XPath(_class_xpath("div", "summary"))],
+    "spiegel.de": [etree.XPath(_class_xpath("div", "RichText")), etree.XPath("//div[@data-area='body']")],
+    "golem.de": [etree.XPath(_class_xpath("div", "formatted")), etree.XPath("//article")],
+    "faz.net": [etree.XPath(_class_xpath("div", "atc-Text")), etree.XPath(_class_xpath("div", "art_txt"))],
+    "nzz.ch": [etree.XPath(_class_xpath("div", "articlecomponent")), etree.XPath(_class_xpath("div", "content-body"))],
+    "derstandard.at": [etree.XPath(_class_xpath("div", "article-body"))],
+}
+
+# Common article containers, tried in order on sites without rules
+GENERIC_RULES = [
+    etree.XPath(expr) for expr in [
+        "//article", _class_xpath("*", "article"), _class_xpath("*", "post"), _class_xpath("*", "content"),
+        "//main", "//*[@id='main']", _class_xpath("*", "main-content"), _class_xpath("*", "entry-content"),
+    ]
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Get the domain of a URL, without a leading "www.".
+    
+    Args:
+        url: URL of an article.
+        
+    Returns:
+        Network location of the URL (e.g. "heise.de").
+    """
+    return urlparse(url).netloc.removeprefix("www.")
+
+
+def _lookup_domain(table: Dict[str, Any], host: str) -> Optional[Any]:
+    """Look up the entry for a domain, also matching its subdomains.
+    
+    Args:
+        table: Dictionary keyed by registered domain (e.g. "heise.de").
+        host: Domain of a URL as returned by _netloc.
+        
+    Returns:
+        The matching entry, or None if the domain is unknown.
+    """
+    entry = table.get(host)
+    if entry is not None:
+        return entry
+    
+    # Try the parent domains of subdomains like "m.heise.de"
+    parts = host.split('.')
+    for i in range(1, len(parts) - 1):
+        entry = table.get('.'.join(parts[i:]))
+        if entry is not None:
+            return entry
+    return None
+
+
+# Runs of whitespace other than newlines, collapsed to a single space
+_WS_RE = re.compile(r'[^\S\n]+')
+# Newlines together with surrounding whitespace and blank lines
+_NL_RE = re.compile(r'\s*\n\s*')
+# Charset declaration in a page's <meta> tags
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+# Any run of whitespace, including newlines
+_SPACE_RE = re.compile(r'\s+')
+
+# Number of articles buffered between the input iterator and the workers
+SCRAPE_QUEUE_SIZE = 32
+# Number of worker threads scraping and classifying articles concurrently
+SCRAPE_WORKERS = 16
+# Minimum and maximum delay (seconds) between two requests to the same domain
+DOMAIN_DELAY = (1, 3)
+# Scraped article content is cached here, keyed by a hash of the URL
+SCRAPE_CACHE_DIR = os.path.expanduser('~/.cache/newsapi/scrape')
+# Age (seconds) after which cached content is revalidated with the server
+SCRAPE_CACHE_TTL = 7 * 24 * 3600
+# Size (bytes) of the chunks a page is read and parsed in
+STREAM_CHUNK_SIZE = 65536
+# Characters of text an <article> needs for the rest of the page to be skipped
+ARTICLE_MIN_TEXT = 500
+# Number of hosts with pooled connections, and keep-alive connections per host
+HTTP_POOL_SIZE = 32
+# Number of scraped articles classified together in a single OpenAI request
+CLASSIFY_BATCH_SIZE = 8
+
+
 class ArticleScraper:
     """Scraper for article content and classifier for relevance."""
     
-    def __init__(self, user_agent: str = None):
+    def __init__(self, user_agent: str = None, cache_dir: Optional[str] = None):
         """Initialize the article scraper.
         
         Args:
             user_agent: User agent to use for requests. If None, a default one is used.
+            cache_dir: Directory to cache scraped content in. If None,
+                SCRAPE_CACHE_DIR is used.
         """
         self.user_agent = user_agent or "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
         self.openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
@@ -50,13 +162,103 @@ class ArticleScraper:
             "Accept": "text/html,application/xhtml+xml,application/xml",
             "Accept-Language": "en-US,en;q=0.9,de;q=0.8"
         })
+        
+        # Retries back off exponentially and honor Retry-After on 429/503
+        retry = Retry(total=3, backoff_factor=1.5, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+        
+        # The default pool keeps 10 connections per host, fewer than the
+        # number of workers, so connections would be closed and the TLS
+        # handshake repeated when many articles come from the same site
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Per-domain throttling state, so requests to unrelated domains
+        # don't wait on each other
+        self._domain_locks: Dict[str, threading.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+        # Serializes console output from worker threads
+        self._print_lock = threading.Lock()
+        
+        # Articles don't change after publication, so scraped content is
+        # cached on disk across runs
+        self.cache_dir = Path(cache_dir or SCRAPE_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _throttle(self, domain: str) -> None:
+        """Wait until the next request to a domain is allowed.
+        
+        Args:
+            domain: Domain about to be requested.
+        """
+        lock = self._domain_locks.setdefault(domain, threading.Lock())
+        with lock:
+            wait = self._last_request.get(domain, 0.0) + random.uniform(*DOMAIN_DELAY) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request[domain] = time.monotonic()
+    
+    def _cache_path(self, url: str) -> Path:
+        """Get the cache file for a URL.
+        
+        Args:
+            url: URL of the article.
+            
+        Returns:
+            Path of the cached content; the validators live next to it in a
+            file with a ``.meta`` suffix.
+        """
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / key[:2] / key[2:]
+    
+    def _store_cached(self, cache_file: Path, content: str, headers: Any) -> None:
+        """Write scraped content and its HTTP validators to the cache.
+        
+        Args:
+            cache_file: Cache file from _cache_path.
+            content: Cleaned article content.
+            headers: Response headers, used for ETag and Last-Modified.
+        """
+        meta = {key: headers[key] for key in ('ETag', 'Last-Modified') if key in headers}
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            cache_file.write_text(content, encoding='utf-8')
+            cache_file.with_suffix('.meta').write_bytes(fastjson.dumps(meta))
+        except OSError as e:
+            with self._print_lock:
+                print(f"Warning: Could not cache {cache_file}: {e}")
+    
+    @staticmethod
+    def _revalidation_headers(cache_file: Path) -> Dict[str, str]:
+        """Build conditional request headers from a cache entry's validators.
+        
+        Args:
+            cache_file: Cache file from _cache_path.
+            
+        Returns:
+            If-None-Match/If-Modified-Since headers, empty if none are known.
+        """
+        try:
+            meta = fastjson.loads(cache_file.with_suffix('.meta').read_bytes())
+        except (OSError, fastjson.JSONDecodeError):
+            return {}
+        
+        headers = {}
+        if 'ETag' in meta:
+            headers['If-None-Match'] = meta['ETag']
+        if 'Last-Modified' in meta:
+            headers['If-Modified-Since'] = meta['Last-Modified']
+        return headers
     
-    def scrape_article_content(self, url: str, max_retries: int = 3) -> Optional[str]:
+    def scrape_article_content(self, url: str) -> Optional[str]:
         """Scrape the content of an article from its URL.
         
+        Content is served from the on-disk cache if it was scraped within
+        SCRAPE_CACHE_TTL; older entries are revalidated with the server.
+        
         Args:
             url: URL of the article.
-            max_retries: Maximum number of retries if the request fails.
             
         Returns:
             Article content as string, or None if scraping failed.
@@ -64,50 +266,154 @@ class ArticleScraper:
         if not url or not url.startswith(('http://', 'https://')):
             return None
             
-        domain = urlparse(url).netloc
+        cache_file = self._cache_path(url)
+        headers = {}
+        if cache_file.exists():
+            if time.time() - cache_file.stat().st_mtime < SCRAPE_CACHE_TTL:
+                return cache_file.read_text(encoding='utf-8')
+            headers = self._revalidation_headers(cache_file)
         
-        # Add a small random delay to avoid rate limiting
-        time.sleep(random.uniform(1, 3))
+        domain = _netloc(url)
         
-        # Try to get the article content
-        retries = 0
-        while retries < max_retries:
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()  # Raise exception for 4XX/5XX responses
-                
-                # Parse the HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.extract()
-                
-                # Extract text based on domain-specific rules
-                content = self._extract_content_by_domain(soup, domain)
-                
-                # If domain-specific extraction failed, use a generic approach
-                if not content or len(content.strip()) < 100:
-                    # Get all text
-                    content = soup.get_text(separator=' ', strip=True)
-                
-                # Clean up the content
-                content = self._clean_content(content)
+        # Space out requests to the same domain to avoid rate limiting
+        self._throttle(domain)
+        
+        # Try to get the article content; failed connections and transient
+        # server errors are retried by the session's adapter
+        try:
+            with self.session.get(url, timeout=10, headers=headers, stream=True) as response:
+                # Unchanged since it was cached; restart its TTL
+                if response.status_code == 304:
+                    cache_file.touch()
+                    return cache_file.read_text(encoding='utf-8')
                 
-                return content
+                response.raise_for_status()  # Raise exception for 4XX/5XX responses
                 
-            except requests.exceptions.RequestException as e:
+                # Parse the HTML content while it is downloaded
+                tree = self._read_tree(response)
+        except requests.exceptions.RequestException as e:
+            with self._print_lock:
                 print(f"Error scraping {url}: {e}")
-                retries += 1
-                time.sleep(random.uniform(2, 5))  # Increasing backoff
+            return None
+        
+        # Extract the article text
+        content = self._parse_content(tree, domain) if tree is not None else ""
+        
+        # Clean up the content
+        content = self._clean_content(content)
+        
+        if content:
+            self._store_cached(cache_file, content, response.headers)
+        
+        return content
+    
+    def _read_tree(self, response: requests.Response) -> Optional[lxml.html.HtmlElement]:
+        """Parse a streamed response, stopping once the article has been read.
+        
+        The page is fed to the parser chunk by chunk. As soon as an <article>
+        element with enough text is complete, the rest of the page is not
+        downloaded.
+        
+        Args:
+            response: Response opened with stream=True.
+            
+        Returns:
+            Root of the parsed page, or None if the page is empty.
+        """
+        chunks = response.iter_content(STREAM_CHUNK_SIZE)
+        head = next(chunks, b'')
+        
+        # Comments are dropped while parsing so they don't end up in the
+        # extracted text
+        parser = etree.HTMLPullParser(events=('end',), tag='article', recover=True, remove_comments=True,
+                                      encoding=self._detect_encoding(response, head))
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        
+        for chunk in itertools.chain((head,), chunks):
+            parser.feed(chunk)
+            if any(len(self._get_text(article)) > ARTICLE_MIN_TEXT for _, article in parser.read_events()):
+                break
         
-        return None
+        try:
+            return parser.close()
+        except etree.XMLSyntaxError:
+            return None
     
-    def _extract_content_by_domain(self, soup: BeautifulSoup, domain: str) -> Optional[str]:
+    @staticmethod
+    def _detect_encoding(response: requests.Response, head: bytes) -> Optional[str]:
+        """Determine the encoding to parse a page with.
+        
+        Without an explicit encoding libxml2 only honors <meta> declarations
+        and otherwise assumes Latin-1, which garbles UTF-8 pages.
+        
+        Args:
+            response: Response of the page.
+            head: First chunk of the page.
+            
+        Returns:
+            Encoding from the Content-Type charset, UTF-8 if the page declares
+            none and its start decodes as UTF-8, otherwise None to let
+            libxml2 detect it.
+        """
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            encoding = requests.utils.get_encoding_from_headers(response.headers)
+            try:
+                return codecs.lookup(encoding).name
+            except LookupError:
+                pass
+        
+        if _META_CHARSET_RE.search(head):
+            return None
+        
+        try:
+            # Incremental, so a character split at the end of the chunk is fine
+            codecs.getincrementaldecoder('utf-8')().decode(head)
+        except UnicodeDecodeError:
+            return None
+        return 'utf-8'
+    
+    def _parse_content(self, tree: lxml.html.HtmlElement, domain: str) -> str:
+        """Extract the text of a parsed article page.
+        
+        Args:
+            tree: Root of the parsed page.
+            domain: Domain of the article.
+            
+        Returns:
+            Extracted article text.
+        """
+        # Remove script and style elements
+        etree.strip_elements(tree, "script", "style", with_tail=False)
+        
+        # Extract text based on domain-specific rules
+        content = self._extract_content_by_domain(tree, domain)
+        
+        # If domain-specific extraction failed, use a generic approach
+        if not content or len(content.strip()) < 100:
+            # Get all text
+            content = self._get_text(tree)
+        
+        return content
+    
+    @staticmethod
+    def _get_text(element: lxml.html.HtmlElement) -> str:
+        """Get the text of an element, joining its text nodes with spaces.
+        
+        Args:
+            element: Parsed HTML element.
+            
+        Returns:
+            Stripped text of the element and its descendants.
+        """
+        # Text nodes are joined with a space, so words in adjacent block
+        # elements (e.g. "<p>a</p><p>b</p>" in minified pages) stay apart
+        return _SPACE_RE.sub(' ', ' '.join(element.itertext())).strip()
+    
+    def _extract_content_by_domain(self, tree: lxml.html.HtmlElement, domain: str) -> Optional[str]:
         """Extract content based on domain-specific rules.
         
         Args:
-            soup: BeautifulSoup object.
+            tree: Parsed HTML page.
             domain: Domain of the article.
             
         Returns:
@@ -116,48 +422,19 @@ class ArticleScraper:
         content = ""
         
         # DACH news sites common patterns
-        if "heise.de" in domain:
-            article = soup.find("article") or soup.find("div", class_="article-content")
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-        
-        elif "zeit.de" in domain:
-            article = soup.find("div", class_="article-body") or soup.find("div", class_="summary")
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-        
-        elif "spiegel.de" in domain:
-            article = soup.find("div", class_="RichText") or soup.find("div", attrs={"data-area": "body"})
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-        
-        elif "golem.de" in domain:
-            article = soup.find("div", class_="formatted") or soup.find("article")
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-        
-        elif "faz.net" in domain:
-            article = soup.find("div", class_="atc-Text") or soup.find("div", class_="art_txt")
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-        
-        elif "nzz.ch" in domain:
-            article = soup.find("div", class_="articlecomponent") or soup.find("div", class_="content-body")
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-        
-        elif "derstandard.at" in domain:
-            article = soup.find("div", class_="article-body")
-            if article:
-                content = article.get_text(separator=' ', strip=True)
-                
+        for xpath in _lookup_domain(DOMAIN_RULES, domain) or ():
+            matches = xpath(tree)
+            if matches:
+                content = self._get_text(matches[0])
+                break
+        
         # Generic extraction for other domains
         if not content:
             # Try common article selectors
-            for selector in ["article", ".article", ".post", ".content", "main", "#main", ".main-content", ".entry-content"]:
-                article = soup.select_one(selector)
-                if article:
-                    content = article.get_text(separator=' ', strip=True)
+            for xpath in GENERIC_RULES:
+                matches = xpath(tree)
+                if matches:
+                    content = self._get_text(matches[0])
                     if len(content) > 300:  # Only use if content is substantial
                         break
         
@@ -173,10 +450,10 @@ class ArticleScraper:
             Cleaned article content.
         """
         # Replace multiple spaces with a single space
-        content = ' '.join(content.split())
+        content = _WS_RE.sub(' ', content)
         
         # Replace multiple newlines with a single newline
-        content = '\n'.join(line.strip() for line in content.split('\n') if line.strip())
+        content = _NL_RE.sub('\n', content).strip()
         
         # Truncate if too long (to fit in OpenAI context)
         if len(content) > 15000:
@@ -194,7 +471,8 @@ class ArticleScraper:
             Tuple of (is_relevant, reason).
         """
         if not self.openai_client:
-            print("Error: OpenAI client not available. Cannot classify article relevance.")
+            with self._print_lock:
+                print("Error: OpenAI client not available. Cannot classify article relevance.")
             return True, "OpenAI classification not available, including by default."
         
         # Prepare article info
@@ -257,64 +535,256 @@ Reason: [1-2 sentence explanation for your decision]
             return is_relevant, reason
             
         except Exception as e:
-            print(f"Error classifying article: {e}")
+            with self._print_lock:
+                print(f"Error classifying article: {e}")
             return True, f"Classification error: {str(e)}"
     
-    def process_articles(self, articles: List[Dict[str, Any]], max_articles: int = None) -> List[Dict[str, Any]]:
-        """Process articles by scraping content and classifying relevance.
+    def classify_batch(self, articles: List[Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        """Classify several articles with a single OpenAI request.
+        
+        Articles the model leaves out of its answer are classified one by
+        one with classify_article_relevance.
         
         Args:
-            articles: List of article dictionaries.
-            max_articles: Maximum number of articles to process.
+            articles: Article dictionaries including content.
             
         Returns:
-            List of processed articles.
+            One (is_relevant, reason) tuple per article, in input order.
         """
-        processed_articles = []
-        total = len(articles)
+        if not self.openai_client:
+            with self._print_lock:
+                print("Error: OpenAI client not available. Cannot classify article relevance.")
+            return [(True, "OpenAI classification not available, including by default.")] * len(articles)
+        
+        sections = []
+        for i, article in enumerate(articles):
+            content = article.get('content', '')
+            sections.append(f"""--- ARTICLE {i} ---
+Title: {article.get('title', '')}
+
+Description: {article.get('description', '')}
+
+Content excerpt:
+{content[:4000] if content else "[No content available]"}
+""")
+        
+        prompt = f"""Analyze each of the following news articles to determine if it is relevant to cybersecurity in the DACH region (Germany, Austria, Switzerland).
+
+{"".join(sections)}
+For each article, answer:
+1. Is this article related to cybersecurity, information security, or digital security?
+2. Is this article relevant to the DACH region (Germany, Austria, Switzerland)?
+
+An article is relevant only if it is about cybersecurity AND involves the DACH region.
+
+Answer with a JSON object of this exact form, with one entry per article:
+{{"results": [{{"i": 0, "relevant": true, "reason": "1-2 sentence explanation for your decision"}}]}}
+"""
         
-        if max_articles:
-            articles = articles[:max_articles]
+        try:
+            response = self.openai_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "You are a cybersecurity analyst specializing in the DACH region."},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.1,
+                max_tokens=150 * len(articles)
+            )
             
-        print(f"Processing {len(articles)} articles (out of {total})...")
+            results = fastjson.loads(response.choices[0].message.content).get('results', [])
+            verdicts = {
+                item['i']: (bool(item.get('relevant')), item.get('reason') or "No reason given")
+                for item in results
+                if isinstance(item, dict) and isinstance(item.get('i'), int)
+            }
+        except Exception as e:
+            with self._print_lock:
+                print(f"Error classifying articles: {e}")
+            return [(True, f"Classification error: {str(e)}")] * len(articles)
         
-        for i, article in enumerate(articles):
-            url = article.get('url', '')
-            print(f"[{i+1}/{len(articles)}] Processing: {url}")
+        return [
+            verdicts[i] if i in verdicts else self.classify_article_relevance(article)
+            for i, article in enumerate(articles)
+        ]
+    
+    async def _scrape_article(self, article: Dict[str, Any], position: int,
+                              executor: ThreadPoolExecutor) -> Optional[List[str]]:
+        """Scrape the content of a single article.
+        
+        Args:
+            article: Article dictionary.
+            position: 1-based position of the article, used in progress output.
+            executor: Thread pool running the blocking network calls.
             
-            # Skip articles without a URL
-            if not url:
-                continue
+        Returns:
+            Progress lines for the article if content was scraped, else None.
+        """
+        url = article.get('url', '')
+        
+        # Skip articles without a URL
+        if not url:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        
+        # Collect the progress lines and print them together, since several
+        # articles are processed at the same time
+        lines = [f"[{position}] Processing: {url}"]
+        
+        # Scrape content
+        content = await loop.run_in_executor(executor, self.scrape_article_content, url)
+        if not content:
+            lines.append(f"  - Failed to scrape content")
+            with self._print_lock:
+                print("\n".join(lines))
+            return None
+        
+        article['content'] = content
+        article['content_length'] = len(content)
+        lines.append(f"  - Content scraped: {len(content)} characters")
+        return lines
+    
+    async def _classify_scraped(self, batch: List[Tuple[int, Dict[str, Any], List[str]]],
+                                executor: ThreadPoolExecutor) -> List[Tuple[int, Dict[str, Any]]]:
+        """Classify a batch of scraped articles with a single request.
+        
+        Args:
+            batch: (position, article, progress lines) of each scraped article.
+            executor: Thread pool running the blocking network calls.
             
-            # Scrape content
-            content = self.scrape_article_content(url)
-            if content:
-                article['content'] = content
-                article['content_length'] = len(content)
-                print(f"  - Content scraped: {len(content)} characters")
-                
-                # Classify relevance
-                is_relevant, reason = self.classify_article_relevance(article)
-                article['is_cybersecurity_relevant'] = is_relevant
-                article['relevance_reason'] = reason
-                
-                if is_relevant:
-                    processed_articles.append(article)
-                    print(f"  - RELEVANT ✓ - {reason}")
-                else:
-                    print(f"  - NOT RELEVANT ✗ - {reason}")
+        Returns:
+            (position, article) of the relevant articles.
+        """
+        loop = asyncio.get_running_loop()
+        verdicts = await loop.run_in_executor(
+            executor, self.classify_batch, [article for _, article, _ in batch]
+        )
+        
+        relevant = []
+        output = []
+        for (position, article, lines), (is_relevant, reason) in zip(batch, verdicts):
+            article['is_cybersecurity_relevant'] = is_relevant
+            article['relevance_reason'] = reason
+            
+            if is_relevant:
+                relevant.append((position, article))
+                lines.append(f"  - RELEVANT ✓ - {reason}")
             else:
-                print(f"  - Failed to scrape content")
+                lines.append(f"  - NOT RELEVANT ✗ - {reason}")
+            output.append("\n".join(lines))
+        
+        with self._print_lock:
+            print("\n".join(output))
+        return relevant
+    
+    async def _process_async(self, articles: Iterable[Dict[str, Any]],
+                             max_articles: Optional[int]) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Scrape and classify articles concurrently.
+        
+        A producer feeds articles from the iterable into a bounded queue and a
+        fixed number of consumers scrape them on a shared thread pool, so only
+        a small window of articles is held in memory at a time. Scraped
+        articles are classified in batches of CLASSIFY_BATCH_SIZE. Articles
+        whose URL was already seen are skipped before any request is made.
+        
+        Args:
+            articles: Iterable of article dictionaries.
+            max_articles: Maximum number of articles to process.
+            
+        Returns:
+            Tuple of (relevant articles in input order, number of articles
+            processed, number of duplicate articles skipped).
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SCRAPE_QUEUE_SIZE)
+        results: List[Tuple[int, Dict[str, Any]]] = []
+        # Scraped articles waiting to be classified in the next batch
+        pending: List[Tuple[int, Dict[str, Any], List[str]]] = []
+        processed = 0
+        duplicates = 0
+        
+        def unique() -> Iterable[Dict[str, Any]]:
+            nonlocal duplicates
+            seen = set()
+            for article in articles:
+                # NewsAPI often lists the same article more than once, with or
+                # without a fragment or trailing slash
+                url = (article.get('url') or '').split('#')[0].rstrip('/')
+                if url in seen:
+                    duplicates += 1
+                    continue
+                if url:
+                    seen.add(url)
+                yield article
+        
+        async def produce() -> None:
+            nonlocal processed
+            for position, article in enumerate(itertools.islice(unique(), max_articles), 1):
+                await queue.put((position, article))
+                processed = position
+            for _ in range(SCRAPE_WORKERS):
+                await queue.put(None)
+        
+        async def consume(executor: ThreadPoolExecutor) -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                position, article = item
+                lines = await self._scrape_article(article, position, executor)
+                if lines is None:
+                    continue
+                
+                pending.append((position, article, lines))
+                if len(pending) >= CLASSIFY_BATCH_SIZE:
+                    batch = pending[:]
+                    pending.clear()
+                    results.extend(await self._classify_scraped(batch, executor))
+        
+        with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+            await asyncio.gather(produce(), *[consume(executor) for _ in range(SCRAPE_WORKERS)])
+            
+            # Classify whatever is left over from the last, incomplete batch
+            if pending:
+                results.extend(await self._classify_scraped(pending, executor))
+        
+        results.sort(key=lambda item: item[0])
+        return [article for _, article in results], processed, duplicates
+    
+    def process_articles(self, articles: Iterable[Dict[str, Any]], max_articles: int = None) -> List[Dict[str, Any]]:
+        """Process articles by scraping content and classifying relevance.
+        
+        Args:
+            articles: List or other iterable (e.g. a generator) of article dictionaries.
+            max_articles: Maximum number of articles to process.
+            
+        Returns:
+            List of processed articles.
+        """
+        if isinstance(articles, Sized):
+            total = len(articles)
+            print(f"Processing {min(max_articles or total, total)} articles (out of {total})...")
+        else:
+            print(f"Processing {f'up to {max_articles}' if max_articles else 'all'} articles...")
+        
+        processed_articles, processed, duplicates = asyncio.run(self._process_async(articles, max_articles or None))
+        
+        if duplicates:
+            print(f"Skipped {duplicates} duplicate articles.")
         
-        print(f"\nClassification complete: {len(processed_articles)} relevant articles identified out of {len(articles)} processed.")
+        print(f"\nClassification complete: {len(processed_articles)} relevant articles identified out of {processed} processed.")
         return processed_articles
     
-    def save_processed_articles(self, articles: List[Dict[str, Any]], output_dir: str = "data") -> str:
+    def save_processed_articles(self, articles: List[Dict[str, Any]], output_dir: str = "data",
+                                pretty: bool = False) -> str:
         """Save processed articles to a JSON file.
         
         Args:
             articles: List of processed article dictionaries.
             output_dir: Directory to save the file.
+            pretty: Whether to indent the JSON. Compact output is smaller
+                and faster to write.
             
         Returns:
             Path to the saved file.
@@ -327,8 +797,8 @@ Reason: [1-2 sentence explanation for your decision]
         filename = f"cybersecurity_relevant_articles_{timestamp}.json"
         file_path = os.path.join(output_dir, filename)
         
-        # Save to JSON
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=4)
+        # Save to JSON; published_at comes in as a datetime from Article.to_dict
+        with open(file_path, 'wb') as f:
+            f.write(fastjson.dumps(articles, pretty=pretty))
         
         return file_path
\ No newline at end of file
@@ -5,17 +5,152 @@
 Data processing utilities for news articles.
 """
 
+import csv
+import io
+import itertools
+import math
 import os
 import sys
-import json
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 # Add the src directory to the Python path to properly resolve imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 # Import Article class directly (avoiding pandas import issues)
 from src.models.article import Article
+from src.utils import fastjson
+
+# Article fields in the order of Article.to_row
+_FIELDS = Article.__slots__
+# Position of published_at in Article.to_row
+_DATE_INDEX = _FIELDS.index('published_at')
+
+# Number of rows formatted per csv writerows call
+CSV_CHUNK_SIZE = 1024
+
+
+def _is_sorted_unique(urls: List[Optional[str]], keys: List[Any]) -> bool:
+    """Check whether articles are already deduplicated and sorted newest first.
+    
+    Stops at the first article that breaks either property.
+    
+    Args:
+        urls: URL of each article.
+        keys: Sort key (publication timestamp) of each article.
+        
+    Returns:
+        Whether _dedup_sort would return the articles unchanged.
+    """
+    seen = set()
+    add = seen.add
+    previous = math.inf
+    for url, key in zip(urls, keys):
+        if not url or url in seen or key > previous:
+            return False
+        add(url)
+        previous = key
+    return True
+
+
+def _dedup_sort(urls: List[Optional[str]], keys: List[Any]) -> List[int]:
+    """Order articles newest first, dropping duplicate and missing URLs.
+    
+    Only the first article with a given URL is kept; articles with equal
+    keys stay in input order.
+    
+    Args:
+        urls: URL of each article.
+        keys: Sort key (publication timestamp) of each article.
+        
+    Returns:
+        Indices of the kept articles, in output order.
+    """
+    seen = set()
+    kept = []
+    # Bind the methods once instead of looking them up on every iteration
+    add = seen.add
+    append = kept.append
+    for i, url in enumerate(urls):
+        if url and url not in seen:
+            add(url)
+            append(i)
+    
+    # Sorting by a bound method of the key list avoids calling a Python
+    # lambda per element
+    kept.sort(key=keys.__getitem__, reverse=True)
+    return kept
+
+
+def _write_json(json_path: str, articles: List[Article], pretty: bool) -> None:
+    """Save articles to a JSON file.
+    
+    Article is a dataclass, so the articles are serialized directly without
+    building a dict for each of them, and one at a time so the whole
+    document is never held in memory.
+    
+    Args:
+        json_path: Path of the JSON file.
+        articles: List of articles to save.
+        pretty: Whether to indent the JSON.
+    """
+    with open(json_path, 'wb') as f:
+        fastjson.dump_array(articles, f, pretty=pretty)
+
+
+def _csv_row(article: Article) -> Tuple[Any, ...]:
+    """Get the CSV row of an article.
+    
+    Args:
+        article: Article to convert.
+        
+    Returns:
+        Article.to_row with the publication date in ISO 8601 format, as in
+        the JSON output.
+    """
+    row = article.to_row()
+    if article.published_at is None:
+        return row
+    return row[:_DATE_INDEX] + (article.published_at.isoformat(),) + row[_DATE_INDEX + 1:]
+
+
+def _write_csv(csv_path: str, articles: List[Article]) -> bool:
+    """Save articles to a CSV file.
+    
+    By default the csv module formats the rows, with the same formatting
+    pandas produces; pandas is only used on request so the module also runs
+    where pandas isn't available (e.g. PyPy).
+    
+    Args:
+        csv_path: Path of the CSV file.
+        articles: List of articles to save.
+        
+    Returns:
+        Whether the file was saved.
+    """
+    try:
+        if os.environ.get("NEWSAPI_USE_PANDAS"):
+            import pandas as pd
+            df = pd.DataFrame.from_records(list(map(_csv_row, articles)), columns=_FIELDS)
+            df.to_csv(csv_path, index=False, encoding='utf-8')
+        else:
+            # Rows are built and formatted CSV_CHUNK_SIZE at a time into an
+            # in-memory buffer that is written out once per chunk
+            rows = map(_csv_row, articles)
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator='\n')
+            writer.writerow(_FIELDS)
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                while chunk := list(itertools.islice(rows, CSV_CHUNK_SIZE)):
+                    writer.writerows(chunk)
+                    f.write(buf.getvalue())
+                    buf.seek(0)
+                    buf.truncate()
+        return True
+    except (ImportError, ValueError, OSError, csv.Error) as e:
+        print(f"Warning: Could not save CSV: {e}")
+        print("Only JSON output will be available.")
+        return False
 
 
 class DataProcessor:
@@ -42,28 +177,28 @@ class DataProcessor:
         # Convert to Article objects
         articles = Article.from_api_response(articles_data)
         
-        # Remove duplicates based on URL
-        unique_urls = set()
-        unique_articles = []
+        # Remove duplicates based on URL and sort by published date (newest
+        # first); the kernel only sees plain lists and returns indices
+        urls = [article.url for article in articles]
+        # Epoch floats compare much faster than timezone-aware datetimes;
+        # articles without a date sort last
+        keys = [article.published_at.timestamp() if article.published_at else -math.inf
+                for article in articles]
         
-        for article in articles:
-            if article.url and article.url not in unique_urls:
-                unique_urls.add(article.url)
-                unique_articles.append(article)
-                
-        # Sort by published date (newest first)
-        unique_articles.sort(
-            key=lambda x: x.published_at if x.published_at else datetime.min, 
-            reverse=True
-        )
+        # NewsAPI results are usually unique and ordered already, in which
+        # case the articles can be returned as they are
+        if _is_sorted_unique(urls, keys):
+            return articles
         
-        return unique_articles
+        return [articles[i] for i in _dedup_sort(urls, keys)]
     
-    def save_articles(self, articles: List[Article]) -> Dict[str, str]:
-        """Save articles to JSON (and CSV if pandas is available).
+    def save_articles(self, articles: List[Article], pretty: bool = False) -> Dict[str, str]:
+        """Save articles to JSON and CSV.
         
         Args:
             articles: List of articles to save.
+            pretty: Whether to indent the JSON. Compact output is about half
+                the size and faster to write.
             
         Returns:
             Dictionary with paths to saved files.
@@ -72,32 +207,16 @@ class DataProcessor:
             print("No articles to save.")
             return {}
             
-        # Create timestamp for filenames
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename_base = f'cybersecurity_news_{timestamp}'
-        
-        # Save paths
-        json_path = os.path.join(self.output_dir, f'{filename_base}.json')
-        csv_path = os.path.join(self.output_dir, f'{filename_base}.csv')
-        
-        # Save to JSON (using list of dicts to maintain format)
-        articles_dicts = [article.to_dict() for article in articles]
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(articles_dicts, f, ensure_ascii=False, indent=4)
+        # Common path of the output files, without extension
+        path_base = f"{self.output_dir}/cybersecurity_news_{datetime.now():%Y%m%d_%H%M%S}"
+        json_path = f"{path_base}.json"
+        csv_path = f"{path_base}.csv"
         
+        _write_json(json_path, articles, pretty)
         output_paths = {'json': json_path}
         
-        # Try to save as CSV if pandas is available
-        try:
-            import pandas as pd
-            # Convert to DataFrame
-            df = pd.DataFrame(articles_dicts)
-            # Save to CSV
-            df.to_csv(csv_path, index=False, encoding='utf-8')
+        if _write_csv(csv_path, articles):
             output_paths['csv'] = csv_path
-        except (ImportError, ValueError, Exception) as e:
-            print(f"Warning: Could not save CSV due to pandas issue: {e}")
-            print("Only JSON output will be available.")
             
         return output_paths
     
@@ -112,13 +231,17 @@ class DataProcessor:
             print("No articles to display.")
             return
             
-        print(f"\nTop {min(limit, len(articles))} recent cybersecurity news articles:")
+        # Collect the output and write it at once instead of printing line by line
+        parts = [f"\nTop {min(limit, len(articles))} recent cybersecurity news articles:\n"]
         
         for i, article in enumerate(articles[:limit], 1):
-            published = article.published_at.strftime('%Y-%m-%d %H:%M') if article.published_at else 'Unknown date'
+            # "YYYY-MM-DD HH:MM"; slicing drops the UTC offset of aware datetimes
+            published = article.published_at.isoformat(sep=' ', timespec='minutes')[:16] if article.published_at else 'Unknown date'
             
-            print(f"\n{i}. {article.title}")
-            print(f"   Published: {published} by {article.source_name}")
-            if article.description:
-                print(f"   {article.description[:100]}..." if len(article.description) > 100 else f"   {article.description}")
-            print(f"   {article.url}")
\ No newline at end of file
+            parts.append(f"\n{i}. {article.title}\n   Published: {published} by {article.source_name}\n")
+            description = article.description
+            if description:
+                parts.append(f"   {description[:100]}...\n" if len(description) > 100 else f"   {description}\n")
+            parts.append(f"   {article.url}\n")
+        
+        sys.stdout.write("".join(parts))
\ No newline at end of file
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON helpers that use orjson when it is installed.
+
+Both functions work with bytes, like orjson, so callers read and write
+files in binary mode regardless of which implementation is used.
+"""
+
+import dataclasses
+import json
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Iterable, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+# Raised by loads on malformed input (orjson's error is a subclass of it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the types orjson handles natively but json does not.
+
+    Args:
+        obj: Object json could not serialize.
+
+    Returns:
+        JSON-serializable representation of the object.
+    """
+    if isinstance(obj, datetime):
+        # Naive datetimes are treated as UTC, like orjson.OPT_NAIVE_UTC
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow, unlike dataclasses.asdict, matching orjson
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        Deserialized object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Datetimes are written in ISO 8601 format, with naive ones treated as UTC.
+    Dataclass instances are written as objects of their fields.
+
+    Args:
+        obj: Object to serialize.
+        pretty: Whether to indent the output by two spaces.
+
+    Returns:
+        JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NAIVE_UTC
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, default=_default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default)
+    return text.encode('utf-8')
+
+
+def dump_array(items: Iterable[Any], f: BinaryIO, pretty: bool = False) -> None:
+    """Write a JSON array to a binary file one element at a time.
+
+    Produces the same bytes as ``f.write(dumps(list(items), pretty))`` but
+    only holds one encoded element in memory at a time.
+
+    Args:
+        items: Elements of the array.
+        f: File opened in binary write mode.
+        pretty: Whether to indent the output by two spaces.
+    """
+    if pretty:
+        opening, separator, closing = b'[\n  ', b',\n  ', b'\n]'
+    else:
+        opening, separator, closing = b'[', b',', b']'
+
+    written = False
+    for item in items:
+        data = dumps(item, pretty)
+        if pretty:
+            # Nest the element's own indentation one level deeper; newlines
+            # inside strings are escaped, so every newline is indentation
+            data = data.replace(b'\n', b'\n  ')
+        f.write(separator if written else opening)
+        f.write(data)
+        written = True
+
+    f.write(closing if written else b'[]')
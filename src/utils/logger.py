@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Logging utilities.
+
+Log records are handed to a queue and written by a background listener
+thread, so slow terminals or pipes don't block the code that logs.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+_log_queue: queue.Queue = queue.Queue()
+_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_listener.start()
+# Flush any pending records before the interpreter exits
+atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a logger that writes through the shared background queue.
+    
+    Args:
+        name: Logger name, usually ``__name__``.
+        
+    Returns:
+        Configured logger.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
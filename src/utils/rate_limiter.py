@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Client-side rate limiting utilities.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace requests against an API quota."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize the token bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold (burst size).
+            refill_rate: Number of tokens added per second.
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens: float = capacity
+        self.last_refill: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill, capped at capacity."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def acquire(self, n: float = 1) -> None:
+        """Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            n: Number of tokens to take.
+        """
+        with self._lock:
+            self._refill()
+            # Reserve the tokens up front so concurrent callers queue up
+            # behind each other instead of all waking at the same moment.
+            self.tokens -= n
+            wait = -self.tokens / self.refill_rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the article scraper.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils.article_scraper import ArticleScraper
+
+TEXT = "Cyberangriff auf Städte und Gemeinden in Österreich. " * 20
+
+
+def _serve(body: bytes, content_type: str):
+    """Start a local HTTP server answering every GET with the given page.
+    
+    Args:
+        body: Response body.
+        content_type: Value of the Content-Type header.
+        
+    Returns:
+        Running server; its URL port is ``server.server_address[1]``.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.mark.parametrize('charset, content_type, meta', [
+    ('utf-8', 'text/html', ''),
+    ('utf-8', 'text/html; charset=utf-8', ''),
+    ('iso-8859-1', 'text/html; charset=ISO-8859-1', ''),
+    ('iso-8859-1', 'text/html', '<meta charset="iso-8859-1">'),
+])
+def test_scrape_decodes_page(tmp_path, charset, content_type, meta):
+    """Pages are decoded with the declared charset, or as UTF-8 without one."""
+    page = f"<html><head>{meta}<title>t</title></head><body><article><p>{TEXT}</p></article></body></html>"
+    server = _serve(page.encode(charset), content_type)
+    try:
+        scraper = ArticleScraper(cache_dir=str(tmp_path))
+        content = scraper.scrape_article_content(f"http://127.0.0.1:{server.server_address[1]}/a")
+    finally:
+        server.shutdown()
+    
+    assert content == TEXT.strip()